@@ -1,11 +1,239 @@
 """Data generator module for creating synthetic blockchain data."""
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone, timedelta
+from itertools import chain
+import json
+import os
 import random
-import uuid
+import secrets
 import string
+import sys
+import time
 import hashlib
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Iterable, Iterator, Sequence
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; the stdlib encoder is used without it
+    orjson = None
+
+
+def _format_id(hex_id: str) -> str:
+    """Format a 32-character hex string as an underscore-delimited id."""
+    return f"{hex_id[:8]}_{hex_id[8:12]}_{hex_id[12:16]}_{hex_id[16:20]}_{hex_id[20:]}"
+
+
+# Random bytes drawn per refill of a generator's hex pool (16384 hex characters)
+HEX_POOL_BYTES = 8192
+
+# Gas parameter triples drawn per refill of a generator's gas pool
+GAS_POOL_SIZE = 256
+
+# Below this many interactions, process start-up costs more than sharding saves
+PARALLEL_MIN_INTERACTIONS = 10_000
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS" prefix) of the last timestamp
+_iso_second_cache: Tuple[int, str] = (-1, "")
+
+
+def _utc_now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string.
+    
+    The date/time prefix is cached per wall-clock second, so most calls only
+    format the microsecond tail instead of building a full datetime.
+    """
+    global _iso_second_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _iso_second_cache
+    if seconds != cached_second:
+        prefix = datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _iso_second_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}+00:00"
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON, using orjson when available.
+    
+    orjson rejects integers wider than 64 bits, which large token amounts in
+    base units can be, so those objects fall back to the stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Interned "ethereum_<type>" topic strings, filled in on first use of each type
+_TOPICS: Dict[str, str] = {}
+
+
+def _topic(interaction_type: str) -> str:
+    """Return the shared topic string for an interaction type."""
+    topic = _TOPICS.get(interaction_type)
+    if topic is None:
+        topic = _TOPICS[interaction_type] = sys.intern(f"ethereum_{interaction_type}")
+    return topic
+
+
+def _interaction_record(
+    tx_hash: str,
+    block_number: int,
+    timestamp: str,
+    sender: Dict[str, Any],
+    receiver: Dict[str, Any],
+    interaction_type: str,
+    value: int,
+    gas_price: int,
+    gas_limit: int,
+    gas_used: int,
+    token_symbol: Any,
+    token_amount: int,
+    message: Optional[str],
+    scenario: str,
+    run_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Assemble the nested interaction dict for one blockchain transaction."""
+    # Create transaction data (following blockchain model structure)
+    transaction = {
+        "hash": tx_hash,
+        "block_number": block_number,
+        "timestamp": timestamp,
+        "from_address": sender["address"],
+        "to_address": receiver["address"],
+        "value": value,
+        "gas_price": gas_price,
+        "gas_limit": gas_limit,
+        "gas_used": gas_used,
+        "status": "success",
+        "chain": "ethereum"
+    }
+    
+    # Create interaction based on the transaction
+    return {
+        "interaction_id": tx_hash,
+        "timestamp": timestamp,
+        "sender_id": sender["id"],
+        "receiver_id": receiver["id"],
+        "topic": _topic(interaction_type),
+        "message": message,
+        "interaction_type": interaction_type,
+        "metadata": {
+            "scenario": scenario,
+            "transaction": transaction,
+            "token_symbol": token_symbol,
+            "token_amount": token_amount,
+            "block": block_number,
+            "blockchain": "ethereum",
+            "gas_fee_eth": (gas_price * gas_used) / 10**18
+        },
+        "run_id": run_id
+    }
+
+
+def _amount_bounds(decimals: int) -> Tuple[Tuple[Tuple[int, ...], Tuple[int, ...]], ...]:
+    """Candidate (minimums, maximums) token amounts in base units, indexed by is_whale."""
+    return (
+        # Normal users: 0.001-0.1 token minimum, 1-100 token maximum
+        (tuple(10 ** (decimals - k) for k in range(1, 4)),
+         tuple(10 ** (decimals + k) for k in range(0, 3))),
+        # Whales: 100-10,000 token minimum, 100K-100M token maximum
+        (tuple(10 ** (decimals + k) for k in range(2, 5)),
+         tuple(10 ** (decimals + k) for k in range(5, 9)))
+    )
+
+
+def _exclusions(values: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    """Map each value to a tuple of all the other values, in their original order."""
+    return {value: tuple(other for other in values if other != value) for value in values}
+
+
+def _pair_symbols(values: Tuple[str, ...], separator: str) -> Dict[str, Dict[str, str]]:
+    """Map first -> second -> interned "<first><separator><second>" for every ordered pair."""
+    return {
+        first: {second: sys.intern(f"{first}{separator}{second}") for second in values if second != first}
+        for first in values
+    }
+
+
+# Bounds for tokens without a known decimals entry (ERC-20 default of 18)
+_DEFAULT_AMOUNT_BOUNDS = _amount_bounds(18)
+
+
+def _block_counts(num_interactions: int, blocks: int) -> List[int]:
+    """Split interactions into exact per-block counts.
+    
+    The remainder of an uneven split goes one extra interaction each to the
+    leading blocks, so the counts always sum to num_interactions. With fewer
+    interactions than blocks, only the blocks that get one are returned.
+    """
+    if num_interactions <= 0 or blocks <= 0:
+        return []
+    base, extra = divmod(num_interactions, blocks)
+    if not base:
+        return [1] * extra
+    return [base + 1] * extra + [base] * (blocks - extra)
+
+
+@dataclass
+class InteractionColumns:
+    """Column-oriented (struct-of-arrays) store of generated blockchain interactions.
+    
+    Every per-interaction field is a parallel list, and values shared by the
+    whole run (run ID, scenario) are stored once instead of in every row.
+    Senders and receivers are kept as references to the agent dicts.
+    """
+    run_id: str
+    scenario: str
+    tx_hash: List[str] = field(default_factory=list)
+    block_number: List[int] = field(default_factory=list)
+    timestamp: List[str] = field(default_factory=list)
+    sender: List[Dict[str, Any]] = field(default_factory=list)
+    receiver: List[Dict[str, Any]] = field(default_factory=list)
+    interaction_type: List[str] = field(default_factory=list)
+    value: List[int] = field(default_factory=list)
+    gas_price: List[int] = field(default_factory=list)
+    gas_limit: List[int] = field(default_factory=list)
+    gas_used: List[int] = field(default_factory=list)
+    token_symbol: List[Any] = field(default_factory=list)
+    token_amount: List[int] = field(default_factory=list)
+    message: List[Optional[str]] = field(default_factory=list)
+    
+    def _rows(self) -> Iterator[Tuple[Any, ...]]:
+        """Iterate the per-row fields in _interaction_record argument order."""
+        return zip(
+            self.tx_hash, self.block_number, self.timestamp, self.sender, self.receiver,
+            self.interaction_type, self.value, self.gas_price, self.gas_limit,
+            self.gas_used, self.token_symbol, self.token_amount, self.message
+        )
+    
+    def __len__(self) -> int:
+        return len(self.tx_hash)
+    
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Build the interaction dict for a single row on demand."""
+        return _interaction_record(
+            self.tx_hash[index], self.block_number[index], self.timestamp[index],
+            self.sender[index], self.receiver[index], self.interaction_type[index],
+            self.value[index], self.gas_price[index], self.gas_limit[index],
+            self.gas_used[index], self.token_symbol[index], self.token_amount[index],
+            self.message[index], self.scenario, self.run_id
+        )
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Yield interaction dicts one row at a time without keeping them."""
+        scenario, run_id = self.scenario, self.run_id
+        for row in self._rows():
+            yield _interaction_record(*row, scenario, run_id)
+    
+    def to_dict_list(self) -> List[Dict[str, Any]]:
+        """Materialize the rows as interaction dicts, as returned by generate_data."""
+        return [_interaction_record(*row, self.scenario, self.run_id) for row in self._rows()]
+
 
 class ScenarioGenerator(ABC):
     """Base interface for scenario generators."""
@@ -29,90 +257,183 @@ class ScenarioGenerator(ABC):
 class BlockchainScenarioGenerator(ScenarioGenerator):
     """Ethereum Blockchain scenario generator for creating synthetic blockchain data."""
     
-    def __init__(self):
-        """Initialize BlockchainScenarioGenerator."""
-        # Wallet types and roles
-        self.wallet_types = ["EOA", "contract"]
-        self.eoa_roles = ["trader", "liquidity_provider", "borrower", "lender", "nft_collector", "whale", "retail"]
-        self.contract_roles = ["dex", "token", "lending", "nft", "bridge", "dao", "staking"]
-        
-        # Transaction types
-        self.transaction_types = [
-            "transfer", "swap", "mint", "burn", "deposit", "withdraw", 
-            "borrow", "repay", "stake", "unstake", "vote", "claim"
-        ]
-        
-        # Token details
-        self.token_symbols = ["ETH", "USDT", "USDC", "DAI", "WETH", "WBTC", "LINK", "UNI", "AAVE", "CRV"]
-        self.token_decimals = {
-            "ETH": 18, "USDT": 6, "USDC": 6, "DAI": 18, "WETH": 18, 
-            "WBTC": 8, "LINK": 18, "UNI": 18, "AAVE": 18, "CRV": 18
+    # Wallet types and roles (class-level so every instance shares one copy)
+    WALLET_TYPES = ("EOA", "contract")
+    EOA_ROLES = ("trader", "liquidity_provider", "borrower", "lender", "nft_collector", "whale", "retail")
+    CONTRACT_ROLES = ("dex", "token", "lending", "nft", "bridge", "dao", "staking")
+    
+    # Transaction types
+    TRANSACTION_TYPES = (
+        "transfer", "swap", "mint", "burn", "deposit", "withdraw", 
+        "borrow", "repay", "stake", "unstake", "vote", "claim"
+    )
+    
+    # Token details
+    TOKEN_SYMBOLS = ("ETH", "USDT", "USDC", "DAI", "WETH", "WBTC", "LINK", "UNI", "AAVE", "CRV")
+    TOKEN_DECIMALS = MappingProxyType({
+        "ETH": 18, "USDT": 6, "USDC": 6, "DAI": 18, "WETH": 18, 
+        "WBTC": 8, "LINK": 18, "UNI": 18, "AAVE": 18, "CRV": 18
+    })
+    # Base units per whole token, and candidate amount bounds, precomputed per token
+    TOKEN_UNITS = MappingProxyType({symbol: 10**d for symbol, d in TOKEN_DECIMALS.items()})
+    TOKEN_AMOUNT_BOUNDS = MappingProxyType({
+        symbol: _amount_bounds(d) for symbol, d in TOKEN_DECIMALS.items()
+    })
+    # Every other token symbol, for picking the second leg of a swap or pool
+    OTHER_TOKENS = MappingProxyType(_exclusions(TOKEN_SYMBOLS))
+    # Shared "IN→OUT" swap and "A/B" pool symbols, so rows reuse one string per pair
+    SWAP_SYMBOLS = MappingProxyType(_pair_symbols(TOKEN_SYMBOLS, "→"))
+    POOL_SYMBOLS = MappingProxyType(_pair_symbols(TOKEN_SYMBOLS, "/"))
+    
+    # Option sets drawn from when building agents and transactions
+    GAS_LIMITS = (21000, 50000, 100000, 200000, 300000)
+    GAS_PRICES = tuple(gwei * 10**9 for gwei in range(1, 101))  # 1-100 gwei in wei
+    TOKEN_DECIMAL_OPTIONS = (6, 8, 18)
+    DEX_NAME_PREFIXES = ("Swap", "Dex", "Exchange", "Uni", "Sushi")
+    DEX_FEE_TIERS = (0.01, 0.05, 0.1, 0.3, 1.0)
+    LENDING_NAME_PREFIXES = ("Lend", "Borrow", "Compound", "Aave", "Lend")
+    NFT_NAME_ADJECTIVES = ("Crypto", "Bored", "Punk", "Cool", "Super")
+    NFT_NAME_NOUNS = ("Apes", "Punks", "Bears", "Pandas", "Art")
+    
+    # Preset scenario templates
+    SCENARIOS = MappingProxyType({
+        "dex": {
+            "name": "Decentralized Exchange",
+            "contracts": ("dex", "token", "token"),
+            "eoawallet_roles": ("trader", "liquidity_provider", "whale", "retail"),
+            "interactions": ("swap", "add_liquidity", "remove_liquidity")
+        },
+        "lending": {
+            "name": "Lending Protocol",
+            "contracts": ("lending", "token", "token"),
+            "eoawallet_roles": ("borrower", "lender", "whale", "retail"),
+            "interactions": ("deposit", "withdraw", "borrow", "repay")
+        },
+        "nft": {
+            "name": "NFT Marketplace",
+            "contracts": ("nft", "token"),
+            "eoawallet_roles": ("nft_collector", "trader", "whale", "retail"),
+            "interactions": ("mint", "transfer", "list", "buy", "sell")
+        },
+        "token_transfer": {
+            "name": "Token Transfer",
+            "contracts": ("token",),
+            "eoawallet_roles": ("trader", "whale", "retail"),
+            "interactions": ("transfer",)
         }
+    })
+    
+    # Full tag set for roles that carry extra tags; other roles are tagged with the role alone
+    EOA_ROLE_TAGS = MappingProxyType({
+        "whale": ("whale", "high_value"),
+        "trader": ("trader", "high_frequency"),
+        "liquidity_provider": ("liquidity_provider", "defi"),
+        "nft_collector": ("nft_collector", "nft")
+    })
+    CONTRACT_ROLE_TAGS = MappingProxyType({
+        "token": ("token", "erc20", "token"),
+        "dex": ("dex", "defi", "dex", "amm"),
+        "lending": ("lending", "defi", "lending", "borrow"),
+        "nft": ("nft", "nft", "erc721")
+    })
+    
+    # Contract role every interaction targets, for scenarios with a fixed receiver
+    RECEIVER_ROLES = MappingProxyType({"dex": "dex", "lending": "lending", "nft": "nft"})
+    
+    def __init__(self, seed: Optional[int] = None):
+        """Initialize BlockchainScenarioGenerator.
         
-        # Preset scenario templates
-        self.scenarios = {
-            "dex": {
-                "name": "Decentralized Exchange",
-                "contracts": ["dex", "token", "token"],
-                "eoawallet_roles": ["trader", "liquidity_provider", "whale", "retail"],
-                "interactions": ["swap", "add_liquidity", "remove_liquidity"]
-            },
-            "lending": {
-                "name": "Lending Protocol",
-                "contracts": ["lending", "token", "token"],
-                "eoawallet_roles": ["borrower", "lender", "whale", "retail"],
-                "interactions": ["deposit", "withdraw", "borrow", "repay"]
-            },
-            "nft": {
-                "name": "NFT Marketplace",
-                "contracts": ["nft", "token"],
-                "eoawallet_roles": ["nft_collector", "trader", "whale", "retail"],
-                "interactions": ["mint", "transfer", "list", "buy", "sell"]
-            },
-            "token_transfer": {
-                "name": "Token Transfer",
-                "contracts": ["token"],
-                "eoawallet_roles": ["trader", "whale", "retail"],
-                "interactions": ["transfer"]
-            }
-        }
+        Args:
+            seed: Optional seed for this generator's private random number
+                generator, for reproducible datasets
+        """
+        self._rng = random.Random(seed)
+        
+        # Pre-drawn hex characters for addresses and hashes (see _take_hex)
+        self._hex_pool = ""
+        self._hex_pos = 0
+        
+        # Pre-drawn (gas_price, gas_limit, gas_used) triples (see _generate_gas_params)
+        self._gas_pool: List[Tuple[int, int, int]] = []
         
         # Current block and time tracking
         self.current_block = 16000000
         self.current_time = datetime.now(timezone.utc)
         self.block_time = 12  # seconds
+        
+        # ISO string of current_time, and the datetime it was formatted from
+        self._time_iso_source: Optional[datetime] = None
+        self._time_iso = ""
+        
+        # Common agent fields per (agent_type, role), copied for each new agent
+        self._agent_prototypes: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    
+    def _take_hex(self, num_chars: int) -> str:
+        """Take random hex characters from a pool refilled in large batches.
+        
+        One randbytes() call fills the pool with enough entropy for over a
+        hundred hashes, instead of one RNG draw per hex character.
+        """
+        start = self._hex_pos
+        end = start + num_chars
+        if end > len(self._hex_pool):
+            self._hex_pool = self._rng.randbytes(HEX_POOL_BYTES).hex()
+            start, end = 0, num_chars
+        self._hex_pos = end
+        return self._hex_pool[start:end]
     
     def _generate_eth_address(self) -> str:
         """Generate a random Ethereum address."""
-        return f"0x{''.join(random.choices('0123456789abcdef', k=40))}"
+        return "0x" + self._take_hex(40)
     
     def _generate_tx_hash(self) -> str:
         """Generate a random transaction hash."""
-        return f"0x{''.join(random.choices('0123456789abcdef', k=64))}"
+        return "0x" + self._take_hex(64)
     
     def _generate_block_hash(self) -> str:
         """Generate a random block hash."""
-        return f"0x{''.join(random.choices('0123456789abcdef', k=64))}"
+        return "0x" + self._take_hex(64)
     
     def _generate_token_amount(self, token: str, is_whale: bool = False) -> int:
         """Generate a realistic token amount in base units."""
-        decimals = self.token_decimals.get(token, 18)
-        
-        if is_whale:
-            min_amount = 10 ** (decimals + random.randint(2, 4))  # 100-10,000 tokens for whales
-            max_amount = 10 ** (decimals + random.randint(5, 8))  # 100K-100M tokens for whales
-        else:
-            min_amount = 10 ** (decimals - random.randint(1, 3))  # 0.001-0.1 tokens for normal users
-            max_amount = 10 ** (decimals + random.randint(0, 2))  # 1-100 tokens for normal users
-            
-        return random.randint(min_amount, max_amount)
+        rng = self._rng
+        min_amounts, max_amounts = self.TOKEN_AMOUNT_BOUNDS.get(token, _DEFAULT_AMOUNT_BOUNDS)[is_whale]
+        return rng.randint(rng.choice(min_amounts), rng.choice(max_amounts))
     
     def _generate_gas_params(self) -> Tuple[int, int, int]:
-        """Generate realistic gas parameters (gas_price, gas_limit, gas_used)."""
-        gas_price = random.randint(1, 100) * 10**9  # 1-100 gwei
-        gas_limit = random.choice([21000, 50000, 100000, 200000, 300000])
-        gas_used = int(gas_limit * random.uniform(0.6, 1.0))  # 60-100% of limit
-        return gas_price, gas_limit, gas_used
+        """Generate realistic gas parameters (gas_price, gas_limit, gas_used).
+        
+        Triples are drawn GAS_POOL_SIZE at a time, with one random.choices call
+        per column, and handed out one per call.
+        """
+        gas_pool = self._gas_pool
+        if not gas_pool:
+            rng = self._rng
+            gas_prices = rng.choices(self.GAS_PRICES, k=GAS_POOL_SIZE)  # 1-100 gwei
+            gas_limits = rng.choices(self.GAS_LIMITS, k=GAS_POOL_SIZE)
+            gas_used = [int(limit * (0.6 + 0.4 * rng.random())) for limit in gas_limits]  # 60-100% of limit
+            gas_pool.extend(zip(gas_prices, gas_limits, gas_used))
+        return gas_pool.pop()
+    
+    def _uniform_fixed(self, low: int, high: int, scale: int) -> float:
+        """Draw a uniform value from low/scale to high/scale in steps of 1/scale.
+        
+        Scales one random() draw to an integer and divides once, which is cheaper
+        than round(uniform(...), places) and yields the exact short decimal.
+        """
+        return (low + int(self._rng.random() * (high - low + 1))) / scale
+    
+    def _current_time_iso(self) -> str:
+        """Return current_time as an ISO string, formatting it once per block.
+        
+        datetimes are immutable, so any change to current_time (advancing a
+        block or assigning a new start time) is a new object and misses the cache.
+        """
+        current_time = self.current_time
+        if current_time is not self._time_iso_source:
+            self._time_iso_source = current_time
+            self._time_iso = current_time.isoformat()
+        return self._time_iso
     
     def _advance_blockchain(self) -> None:
         """Advance blockchain state by one block."""
@@ -127,248 +448,381 @@ class BlockchainScenarioGenerator(ScenarioGenerator):
         else:
             return name[:3].upper()
     
-    def create_agent(self, agent_type: Optional[str] = None, role: Optional[str] = None) -> Dict[str, Any]:
-        """Create a blockchain agent (wallet or contract)."""
+    def create_agent(
+        self,
+        agent_type: Optional[str] = None,
+        role: Optional[str] = None,
+        created_at: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a blockchain agent (wallet or contract).
+        
+        Args:
+            agent_type: "EOA" or "contract" (random if omitted)
+            role: Wallet or contract role (random for the type if omitted)
+            created_at: ISO timestamp to record; batch callers pass one shared
+                value instead of reading the clock for every agent
+        """
+        rng = self._rng
+        
         if not agent_type:
-            agent_type = random.choice(self.wallet_types)
+            agent_type = rng.choice(self.WALLET_TYPES)
             
         if not role:
             if agent_type == "EOA":
-                role = random.choice(self.eoa_roles)
+                role = rng.choice(self.EOA_ROLES)
             else:  # Contract
-                role = random.choice(self.contract_roles)
+                role = rng.choice(self.CONTRACT_ROLES)
         
         # Generate address and base agent properties
         address = self._generate_eth_address()
         agent_id = address.lower()
+        seen_at = self._current_time_iso()
         
-        # Common properties
-        agent = {
-            "id": agent_id,
-            "address": address,
-            "type": agent_type,
-            "role": role,
-            "chain": "ethereum",
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "first_seen": self.current_time.isoformat(),
-            "last_active": self.current_time.isoformat(),
-            "balance": 0.0,
-            "transactions": [],
-            "tags": [role]
-        }
+        # Common properties, copied from the archetype's prototype
+        prototype = self._agent_prototypes.get((agent_type, role))
+        if prototype is None:
+            prototype = self._agent_prototypes[(agent_type, role)] = self._agent_prototype(agent_type, role)
+        agent = prototype.copy()
+        agent["id"] = agent_id
+        agent["address"] = address
+        agent["created_at"] = created_at or _utc_now_iso()
+        agent["first_seen"] = agent["last_active"] = seen_at
+        agent["transactions"] = []
+        agent["tags"] = list(prototype["tags"])
         
         # Type-specific properties
         if agent_type == "EOA":
             # Regular wallet
-            agent["balance"] = round(random.uniform(0.1, 100.0), 6)  # ETH balance
-            agent["nonce"] = random.randint(1, 100)
+            agent["balance"] = self._uniform_fixed(100_000, 100_000_000, 10**6)  # 0.1-100 ETH
+            agent["nonce"] = rng.randint(1, 100)
             
             # Add role-specific properties
             if role == "whale":
-                agent["balance"] = round(random.uniform(100.0, 10000.0), 6)
-                agent["tags"].append("high_value")
-            elif role == "trader":
-                agent["tags"].append("high_frequency")
-            elif role == "liquidity_provider":
-                agent["tags"].append("defi")
-            elif role == "nft_collector":
-                agent["tags"].append("nft")
+                agent["balance"] = self._uniform_fixed(10**8, 10**10, 10**6)  # 100-10,000 ETH
         
         else:  # Contract
             # Smart contract
-            agent["verified"] = random.choice([True, False])
+            agent["verified"] = rng.choice((True, False))
             agent["creation_tx"] = self._generate_tx_hash()
             agent["creation_block"] = self.current_block
             
             # Contract-specific properties based on role
-            if role == "token":
-                token_name = ''.join(random.choice(string.ascii_uppercase) for _ in range(3))
-                agent["name"] = f"{token_name} Token"
-                agent["symbol"] = token_name
-                agent["decimals"] = random.choice([6, 8, 18])
-                agent["total_supply"] = 10 ** (agent["decimals"] + random.randint(7, 9))
-                agent["tags"].extend(["erc20", "token"])
-            
-            elif role == "dex":
-                agent["name"] = f"{random.choice(['Swap', 'Dex', 'Exchange', 'Uni', 'Sushi'])}Swap v{random.randint(1,3)}"
-                agent["factory"] = self._generate_eth_address()
-                agent["fee_tier"] = random.choice([0.01, 0.05, 0.1, 0.3, 1.0])
-                agent["total_volume_usd"] = random.randint(10**5, 10**9)
-                agent["tags"].extend(["defi", "dex", "amm"])
-            
-            elif role == "lending":
-                agent["name"] = f"{random.choice(['Lend', 'Borrow', 'Compound', 'Aave', 'Lend'])}Protocol"
-                agent["total_supplied"] = random.randint(10**6, 10**9)
-                agent["total_borrowed"] = int(agent["total_supplied"] * random.uniform(0.4, 0.8))
-                agent["tags"].extend(["defi", "lending", "borrow"])
-            
-            elif role == "nft":
-                agent["name"] = f"{random.choice(['Crypto', 'Bored', 'Punk', 'Cool', 'Super'])} {random.choice(['Apes', 'Punks', 'Bears', 'Pandas', 'Art'])}"
-                agent["floor_price"] = round(random.uniform(0.01, 100.0), 3)
-                agent["total_supply"] = random.randint(1000, 10000)
-                agent["minted"] = random.randint(100, agent["total_supply"])
-                agent["tags"].extend(["nft", "erc721"])
+            init_contract = self._CONTRACT_INITIALIZERS.get(role)
+            if init_contract:
+                init_contract(self, agent, rng)
         
         # Calculate risk score based on randomized attributes
-        agent["risk_score"] = random.uniform(0, 100)
+        agent["risk_score"] = rng.uniform(0, 100)
         
         return agent
     
+    def _agent_prototype(self, agent_type: str, role: str) -> Dict[str, Any]:
+        """Build the common agent fields shared by every (agent_type, role) agent.
+        
+        Per-agent fields are placeholders here and are filled in by create_agent;
+        tags are stored as a tuple and copied into a fresh list per agent.
+        """
+        role_tags = (self.EOA_ROLE_TAGS if agent_type == "EOA" else self.CONTRACT_ROLE_TAGS).get(role)
+        return {
+            "id": "",
+            "address": "",
+            "type": agent_type,
+            "role": role,
+            "chain": "ethereum",
+            "created_at": "",
+            "first_seen": "",
+            "last_active": "",
+            "balance": 0.0,
+            "transactions": None,
+            "tags": role_tags or (role,)
+        }
+    
+    def _init_token_contract(self, agent: Dict[str, Any], rng: random.Random) -> None:
+        """Add ERC-20 token details to a contract agent."""
+        token_name = ''.join(rng.choice(string.ascii_uppercase) for _ in range(3))
+        agent["name"] = f"{token_name} Token"
+        agent["symbol"] = token_name
+        agent["decimals"] = rng.choice(self.TOKEN_DECIMAL_OPTIONS)
+        agent["total_supply"] = 10 ** (agent["decimals"] + rng.randint(7, 9))
+    
+    def _init_dex_contract(self, agent: Dict[str, Any], rng: random.Random) -> None:
+        """Add DEX pool details to a contract agent."""
+        agent["name"] = f"{rng.choice(self.DEX_NAME_PREFIXES)}Swap v{rng.randint(1,3)}"
+        agent["factory"] = self._generate_eth_address()
+        agent["fee_tier"] = rng.choice(self.DEX_FEE_TIERS)
+        agent["total_volume_usd"] = rng.randint(10**5, 10**9)
+    
+    def _init_lending_contract(self, agent: Dict[str, Any], rng: random.Random) -> None:
+        """Add lending protocol details to a contract agent."""
+        agent["name"] = f"{rng.choice(self.LENDING_NAME_PREFIXES)}Protocol"
+        agent["total_supplied"] = rng.randint(10**6, 10**9)
+        agent["total_borrowed"] = int(agent["total_supplied"] * rng.uniform(0.4, 0.8))
+    
+    def _init_nft_contract(self, agent: Dict[str, Any], rng: random.Random) -> None:
+        """Add NFT collection details to a contract agent."""
+        agent["name"] = f"{rng.choice(self.NFT_NAME_ADJECTIVES)} {rng.choice(self.NFT_NAME_NOUNS)}"
+        agent["floor_price"] = self._uniform_fixed(10, 100_000, 1000)  # 0.01-100 ETH
+        agent["total_supply"] = rng.randint(1000, 10000)
+        agent["minted"] = rng.randint(100, agent["total_supply"])
+    
+    # Role-specific contract setup, looked up once per contract instead of an if/elif chain
+    _CONTRACT_INITIALIZERS = MappingProxyType({
+        "token": _init_token_contract,
+        "dex": _init_dex_contract,
+        "lending": _init_lending_contract,
+        "nft": _init_nft_contract
+    })
+    
+    def create_agents(
+        self,
+        num_agents: int,
+        agent_type: Optional[str] = "EOA",
+        roles: Optional[Sequence[str]] = None,
+        created_at: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Create a batch of agents of one type.
+        
+        Args:
+            num_agents: Number of agents to create
+            agent_type: "EOA" or "contract"; if omitted, each agent's type follows
+                its role (contract for CONTRACT_ROLES), or is random when no
+                roles are given
+            roles: Roles to draw from (defaults to every role for the type)
+            created_at: Shared ISO creation timestamp (defaults to now)
+            
+        Returns:
+            List of agent dicts, with all roles drawn in a single batch
+        """
+        created_at = created_at or _utc_now_iso()
+        if not agent_type:
+            if roles is None:
+                # Each agent draws its own type, so its role must match that type
+                return [self.create_agent(None, None, created_at) for _ in range(num_agents)]
+            return [
+                self.create_agent("contract" if role in self.CONTRACT_ROLES else "EOA", role, created_at)
+                for role in self._rng.choices(roles, k=num_agents)
+            ]
+        if roles is None:
+            roles = self.EOA_ROLES if agent_type == "EOA" else self.CONTRACT_ROLES
+        return [
+            self.create_agent(agent_type, role, created_at)
+            for role in self._rng.choices(roles, k=num_agents)
+        ]
+    
     def generate_interaction(
         self, 
         sender: Dict[str, Any], 
         receiver: Dict[str, Any], 
         scenario: str = "token_transfer",
-        block_number: Optional[int] = None
+        block_number: Optional[int] = None,
+        include_message: bool = True,
+        *,
+        run_id: Optional[str] = None,
+        interaction_type: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Generate a blockchain interaction between two agents."""
+        """Generate a blockchain interaction between two agents.
+        
+        Pass include_message=False to skip rendering the human-readable message
+        when only the structured fields are needed; "message" is then None.
+        The run_id, if given, is stored on the interaction as it is built.
+        interaction_type may be pre-drawn by batch callers; otherwise one is
+        chosen from the scenario's interactions.
+        """
         # Use current block if not specified
         if block_number is None:
             block_number = self.current_block
-            
-        # Determine interaction type based on scenario and agent roles
-        interaction_types = self.scenarios[scenario]["interactions"]
-        interaction_type = random.choice(interaction_types)
+        
+        (interaction_type, tx_hash, gas_price, gas_limit, gas_used, value,
+         token_symbol, token_amount, message) = self._draw_interaction(
+            sender, receiver, scenario, include_message, interaction_type
+        )
+        
+        return _interaction_record(
+            tx_hash, block_number, self._current_time_iso(), sender, receiver,
+            interaction_type, value, gas_price, gas_limit, gas_used,
+            token_symbol, token_amount, message, scenario, run_id
+        )
+    
+    def _draw_interaction(
+        self,
+        sender: Dict[str, Any],
+        receiver: Dict[str, Any],
+        scenario: str,
+        include_message: bool = True,
+        interaction_type: Optional[str] = None
+    ) -> Tuple[str, str, int, int, int, int, Any, int, Optional[str]]:
+        """Draw the randomized fields of one interaction without building any dicts.
+        
+        Type-specific fields come from the handler registered for the interaction
+        type in _INTERACTION_HANDLERS. Handlers only return a %-style template and
+        its arguments; the message itself is rendered once here, and not at all
+        when ``include_message`` is False.
+        
+        Returns:
+            Tuple of (interaction_type, tx_hash, gas_price, gas_limit, gas_used,
+            value, token_symbol, token_amount, message)
+        """
+        # Determine interaction type based on scenario, unless pre-drawn
+        if interaction_type is None:
+            interaction_type = self._rng.choice(self.SCENARIOS[scenario]["interactions"])
         
         # Generate common transaction properties
         tx_hash = self._generate_tx_hash()
         gas_price, gas_limit, gas_used = self._generate_gas_params()
-        value = 0  # Default to 0 ETH unless specified
-        
-        # Generate transaction based on type
-        if interaction_type == "transfer":
-            # Simple token or ETH transfer
-            if random.random() < 0.3:  # 30% chance of ETH transfer
-                value = int(random.uniform(0.001, 1.0) * 10**18)  # Convert ETH to wei
-                token_symbol = "ETH"
-                token_amount = value
-                message = f"Transferred {value / 10**18:.6f} ETH from {sender['role']} to {receiver['role']}"
-            else:  # Token transfer
-                token_symbol = random.choice(self.token_symbols)
-                token_amount = self._generate_token_amount(token_symbol, sender["role"] == "whale")
-                message = f"Transferred {token_amount / 10**self.token_decimals[token_symbol]:.6f} {token_symbol} from {sender['role']} to {receiver['role']}"
-                
-        elif interaction_type == "swap":
-            # DEX swap
-            token_in = random.choice(self.token_symbols)
-            token_out = random.choice([t for t in self.token_symbols if t != token_in])
-            amount_in = self._generate_token_amount(token_in, sender["role"] == "whale")
-            amount_out = int(amount_in * random.uniform(0.9, 1.1) * 
-                            (10**self.token_decimals[token_out] / 10**self.token_decimals[token_in]))
-            
-            message = f"Swapped {amount_in / 10**self.token_decimals[token_in]:.6f} {token_in} for {amount_out / 10**self.token_decimals[token_out]:.6f} {token_out}"
-            token_symbol = f"{token_in}→{token_out}"
-            token_amount = amount_in
-        
-        elif interaction_type in ["deposit", "withdraw"]:
-            # Lending protocol interaction
-            token_symbol = random.choice(self.token_symbols)
-            token_amount = self._generate_token_amount(token_symbol, sender["role"] == "whale")
-            
-            if interaction_type == "deposit":
-                message = f"Deposited {token_amount / 10**self.token_decimals[token_symbol]:.6f} {token_symbol} into {receiver.get('name', 'protocol')}"
-            else:
-                message = f"Withdrew {token_amount / 10**self.token_decimals[token_symbol]:.6f} {token_symbol} from {receiver.get('name', 'protocol')}"
-                
-        elif interaction_type in ["borrow", "repay"]:
-            # Lending protocol interaction
-            token_symbol = random.choice(self.token_symbols)
-            token_amount = self._generate_token_amount(token_symbol, sender["role"] == "whale")
-            interest_rate = round(random.uniform(0.01, 0.2), 4)
-            
-            if interaction_type == "borrow":
-                message = f"Borrowed {token_amount / 10**self.token_decimals[token_symbol]:.6f} {token_symbol} at {interest_rate:.2%} interest"
-            else:
-                message = f"Repaid {token_amount / 10**self.token_decimals[token_symbol]:.6f} {token_symbol} loan"
-        
-        elif interaction_type in ["mint", "burn"]:
-            # NFT or token mint/burn
-            if receiver.get("role") == "nft":
-                token_amount = random.randint(1, 5)  # Number of NFTs
-                if interaction_type == "mint":
-                    message = f"Minted {token_amount} NFT(s) from {receiver.get('name', 'collection')}"
-                else:
-                    message = f"Burned {token_amount} NFT(s) from {receiver.get('name', 'collection')}"
-                token_symbol = f"{receiver.get('name', 'NFT')} NFT"
-            else:
-                token_symbol = random.choice(self.token_symbols)
-                token_amount = self._generate_token_amount(token_symbol, sender["role"] == "whale")
-                if interaction_type == "mint":
-                    message = f"Minted {token_amount / 10**self.token_decimals[token_symbol]:.6f} {token_symbol}"
-                else:
-                    message = f"Burned {token_amount / 10**self.token_decimals[token_symbol]:.6f} {token_symbol}"
-        
-        elif interaction_type in ["add_liquidity", "remove_liquidity"]:
-            # DEX liquidity provision
-            token_a = random.choice(self.token_symbols)
-            token_b = random.choice([t for t in self.token_symbols if t != token_a])
-            token_a_amount = self._generate_token_amount(token_a, sender["role"] == "whale")
-            token_b_amount = self._generate_token_amount(token_b, sender["role"] == "whale")
-            
-            if interaction_type == "add_liquidity":
-                message = f"Added liquidity: {token_a_amount / 10**self.token_decimals[token_a]:.6f} {token_a} and {token_b_amount / 10**self.token_decimals[token_b]:.6f} {token_b}"
-            else:
-                message = f"Removed liquidity: {token_a_amount / 10**self.token_decimals[token_a]:.6f} {token_a} and {token_b_amount / 10**self.token_decimals[token_b]:.6f} {token_b}"
-            token_symbol = f"{token_a}/{token_b}"
-            token_amount = token_a_amount
-            
-        elif interaction_type in ["list", "buy", "sell"]:
-            # NFT marketplace interactions
-            nft_id = random.randint(1, 10000)
-            price = round(random.uniform(0.01, 100.0), 3)
-            token_amount = 1
-            
-            if interaction_type == "list":
-                message = f"Listed NFT #{nft_id} from {receiver.get('name', 'collection')} for {price} ETH"
-            elif interaction_type == "buy":
-                message = f"Bought NFT #{nft_id} from {receiver.get('name', 'collection')} for {price} ETH"
-                value = int(price * 10**18)  # Convert ETH to wei
-            else:
-                message = f"Sold NFT #{nft_id} from {receiver.get('name', 'collection')} for {price} ETH"
-            token_symbol = f"{receiver.get('name', 'NFT')} #{nft_id}"
+        
+        # Generate the type-specific fields
+        draw = self._INTERACTION_HANDLERS.get(interaction_type)
+        if draw is None:
+            draw = BlockchainScenarioGenerator._draw_generic
+        value, token_symbol, token_amount, message_fmt, message_args = draw(
+            self, interaction_type, sender, receiver, sender["role"] == "whale"
+        )
+        
+        message = message_fmt % message_args if include_message else None
             
+        return (interaction_type, tx_hash, gas_price, gas_limit, gas_used, value,
+                token_symbol, token_amount, message)
+    
+    # Interaction handlers: each returns (value, token_symbol, token_amount,
+    # message template, message arguments) for one interaction type
+    
+    def _draw_transfer(
+        self, interaction_type: str, sender: Dict[str, Any], receiver: Dict[str, Any], is_whale: bool
+    ) -> Tuple[int, Any, int, str, Tuple[Any, ...]]:
+        """Simple token or ETH transfer."""
+        rng = self._rng
+        if rng.random() < 0.3:  # 30% chance of ETH transfer
+            value = int(rng.uniform(0.001, 1.0) * 10**18)  # Convert ETH to wei
+            return (value, "ETH", value, "Transferred %.6f ETH from %s to %s",
+                    (value / 10**18, sender["role"], receiver["role"]))
+        # Token transfer
+        token_symbol = rng.choice(self.TOKEN_SYMBOLS)
+        token_amount = self._generate_token_amount(token_symbol, is_whale)
+        return (0, token_symbol, token_amount, "Transferred %.6f %s from %s to %s",
+                (token_amount / self.TOKEN_UNITS[token_symbol], token_symbol,
+                 sender["role"], receiver["role"]))
+    
+    def _draw_swap(
+        self, interaction_type: str, sender: Dict[str, Any], receiver: Dict[str, Any], is_whale: bool
+    ) -> Tuple[int, Any, int, str, Tuple[Any, ...]]:
+        """DEX swap."""
+        rng = self._rng
+        units = self.TOKEN_UNITS
+        token_in = rng.choice(self.TOKEN_SYMBOLS)
+        token_out = rng.choice(self.OTHER_TOKENS[token_in])
+        amount_in = self._generate_token_amount(token_in, is_whale)
+        amount_out = int(amount_in * rng.uniform(0.9, 1.1) * (units[token_out] / units[token_in]))
+        return (0, self.SWAP_SYMBOLS[token_in][token_out], amount_in, "Swapped %.6f %s for %.6f %s",
+                (amount_in / units[token_in], token_in, amount_out / units[token_out], token_out))
+    
+    def _draw_deposit_withdraw(
+        self, interaction_type: str, sender: Dict[str, Any], receiver: Dict[str, Any], is_whale: bool
+    ) -> Tuple[int, Any, int, str, Tuple[Any, ...]]:
+        """Lending protocol deposit or withdrawal."""
+        token_symbol = self._rng.choice(self.TOKEN_SYMBOLS)
+        token_amount = self._generate_token_amount(token_symbol, is_whale)
+        if interaction_type == "deposit":
+            message_fmt = "Deposited %.6f %s into %s"
         else:
-            # Generic interaction
-            token_symbol = random.choice(self.token_symbols)
-            token_amount = self._generate_token_amount(token_symbol, sender["role"] == "whale")
-            message = f"{interaction_type} interaction: {sender['role']} to {receiver['role']}"
-            
-        # Create transaction data (following blockchain model structure)
-        transaction = {
-            "hash": tx_hash,
-            "block_number": block_number,
-            "timestamp": self.current_time.isoformat(),
-            "from_address": sender["address"],
-            "to_address": receiver["address"],
-            "value": value,
-            "gas_price": gas_price,
-            "gas_limit": gas_limit,
-            "gas_used": gas_used,
-            "status": "success",
-            "chain": "ethereum"
-        }
-            
-        # Create interaction based on the transaction
-        interaction = {
-            "interaction_id": tx_hash,
-            "timestamp": self.current_time.isoformat(),
-            "sender_id": sender["id"],
-            "receiver_id": receiver["id"],
-            "topic": f"ethereum_{interaction_type}",
-            "message": message,
-            "interaction_type": interaction_type,
-            "metadata": {
-                "scenario": scenario,
-                "transaction": transaction,
-                "token_symbol": token_symbol,
-                "token_amount": token_amount,
-                "block": block_number,
-                "blockchain": "ethereum",
-                "gas_fee_eth": (gas_price * gas_used) / 10**18
-            }
-        }
+            message_fmt = "Withdrew %.6f %s from %s"
+        return (0, token_symbol, token_amount, message_fmt,
+                (token_amount / self.TOKEN_UNITS[token_symbol], token_symbol,
+                 receiver.get("name", "protocol")))
+    
+    def _draw_borrow_repay(
+        self, interaction_type: str, sender: Dict[str, Any], receiver: Dict[str, Any], is_whale: bool
+    ) -> Tuple[int, Any, int, str, Tuple[Any, ...]]:
+        """Lending protocol borrow or repayment."""
+        token_symbol = self._rng.choice(self.TOKEN_SYMBOLS)
+        token_amount = self._generate_token_amount(token_symbol, is_whale)
+        interest_rate = self._uniform_fixed(100, 2000, 10_000)  # 1-20%
+        amount = token_amount / self.TOKEN_UNITS[token_symbol]
+        if interaction_type == "borrow":
+            return (0, token_symbol, token_amount, "Borrowed %.6f %s at %.2f%% interest",
+                    (amount, token_symbol, interest_rate * 100))
+        return (0, token_symbol, token_amount, "Repaid %.6f %s loan", (amount, token_symbol))
+    
+    def _draw_mint_burn(
+        self, interaction_type: str, sender: Dict[str, Any], receiver: Dict[str, Any], is_whale: bool
+    ) -> Tuple[int, Any, int, str, Tuple[Any, ...]]:
+        """NFT or token mint/burn."""
+        if receiver["role"] == "nft":
+            token_amount = self._rng.randint(1, 5)  # Number of NFTs
+            if interaction_type == "mint":
+                message_fmt = "Minted %d NFT(s) from %s"
+            else:
+                message_fmt = "Burned %d NFT(s) from %s"
+            return (0, sys.intern(f"{receiver.get('name', 'NFT')} NFT"), token_amount, message_fmt,
+                    (token_amount, receiver.get("name", "collection")))
         
-        return interaction
+        token_symbol = self._rng.choice(self.TOKEN_SYMBOLS)
+        token_amount = self._generate_token_amount(token_symbol, is_whale)
+        if interaction_type == "mint":
+            message_fmt = "Minted %.6f %s"
+        else:
+            message_fmt = "Burned %.6f %s"
+        return (0, token_symbol, token_amount, message_fmt,
+                (token_amount / self.TOKEN_UNITS[token_symbol], token_symbol))
+    
+    def _draw_liquidity(
+        self, interaction_type: str, sender: Dict[str, Any], receiver: Dict[str, Any], is_whale: bool
+    ) -> Tuple[int, Any, int, str, Tuple[Any, ...]]:
+        """DEX liquidity provision or removal."""
+        rng = self._rng
+        units = self.TOKEN_UNITS
+        token_a = rng.choice(self.TOKEN_SYMBOLS)
+        token_b = rng.choice(self.OTHER_TOKENS[token_a])
+        token_a_amount = self._generate_token_amount(token_a, is_whale)
+        token_b_amount = self._generate_token_amount(token_b, is_whale)
+        if interaction_type == "add_liquidity":
+            message_fmt = "Added liquidity: %.6f %s and %.6f %s"
+        else:
+            message_fmt = "Removed liquidity: %.6f %s and %.6f %s"
+        return (0, self.POOL_SYMBOLS[token_a][token_b], token_a_amount, message_fmt,
+                (token_a_amount / units[token_a], token_a, token_b_amount / units[token_b], token_b))
+    
+    def _draw_nft_trade(
+        self, interaction_type: str, sender: Dict[str, Any], receiver: Dict[str, Any], is_whale: bool
+    ) -> Tuple[int, Any, int, str, Tuple[Any, ...]]:
+        """NFT marketplace listing, purchase or sale."""
+        nft_id = self._rng.randint(1, 10000)
+        price = self._uniform_fixed(10, 100_000, 1000)  # 0.01-100 ETH
+        value = 0
+        if interaction_type == "list":
+            message_fmt = "Listed NFT #%d from %s for %s ETH"
+        elif interaction_type == "buy":
+            message_fmt = "Bought NFT #%d from %s for %s ETH"
+            value = int(price * 10**18)  # Convert ETH to wei
+        else:
+            message_fmt = "Sold NFT #%d from %s for %s ETH"
+        return (value, f"{receiver.get('name', 'NFT')} #{nft_id}", 1, message_fmt,
+                (nft_id, receiver.get("name", "collection"), price))
+    
+    def _draw_generic(
+        self, interaction_type: str, sender: Dict[str, Any], receiver: Dict[str, Any], is_whale: bool
+    ) -> Tuple[int, Any, int, str, Tuple[Any, ...]]:
+        """Any other interaction type."""
+        token_symbol = self._rng.choice(self.TOKEN_SYMBOLS)
+        token_amount = self._generate_token_amount(token_symbol, is_whale)
+        return (0, token_symbol, token_amount, "%s interaction: %s to %s",
+                (interaction_type, sender["role"], receiver["role"]))
+    
+    # One dict lookup per interaction instead of an if/elif cascade over type strings
+    _INTERACTION_HANDLERS = MappingProxyType({
+        "transfer": _draw_transfer,
+        "swap": _draw_swap,
+        "deposit": _draw_deposit_withdraw,
+        "withdraw": _draw_deposit_withdraw,
+        "borrow": _draw_borrow_repay,
+        "repay": _draw_borrow_repay,
+        "mint": _draw_mint_burn,
+        "burn": _draw_mint_burn,
+        "add_liquidity": _draw_liquidity,
+        "remove_liquidity": _draw_liquidity,
+        "list": _draw_nft_trade,
+        "buy": _draw_nft_trade,
+        "sell": _draw_nft_trade
+    })
     
     def generate_data(
         self, 
@@ -376,6 +830,7 @@ class BlockchainScenarioGenerator(ScenarioGenerator):
         num_interactions: int, 
         scenario: str = "token_transfer", 
         blocks: int = 100, 
+        include_message: bool = True,
         **kwargs
     ) -> Dict[str, Any]:
         """Generate blockchain scenario data.
@@ -385,112 +840,261 @@ class BlockchainScenarioGenerator(ScenarioGenerator):
             num_interactions: Number of interactions to generate
             scenario: Type of scenario (dex, lending, nft, token_transfer)
             blocks: Number of blocks to simulate
+            include_message: Whether to render each interaction's message text
             
         Returns:
             Dictionary containing agents, interactions, and run metadata
         """
         # Validate scenario
-        if scenario not in self.scenarios:
+        if scenario not in self.SCENARIOS:
             scenario = "token_transfer"  # Default to simple transfers
             
-        # Determine agent distribution
-        num_contracts = max(1, num_agents // 5)  # 20% contracts
-        num_eoa = num_agents - num_contracts
+        agents, run_id, interaction_iter = self.generate_data_iter(
+            num_agents, num_interactions, scenario=scenario, blocks=blocks,
+            include_message=include_message
+        )
+        interactions = list(interaction_iter)
         
-        # Select roles based on scenario
-        contract_roles = self.scenarios[scenario]["contracts"]
-        eoa_roles = self.scenarios[scenario]["eoawallet_roles"]
-        
-        # Create agents (wallets and contracts)
-        contracts = []
-        for _ in range(num_contracts):
-            role = random.choice(contract_roles)
-            contracts.append(self.create_agent("contract", role))
+        return {
+            "wallets": agents,
+            "transactions": interactions,
+            "run_id": run_id,
+            "scenario": scenario,
+            "blockchain": "ethereum",
+            "start_block": self.current_block - blocks,
+            "end_block": self.current_block - 1
+        }
+    
+    def generate_data_iter(
+        self,
+        num_agents: int,
+        num_interactions: int,
+        scenario: str = "token_transfer",
+        blocks: int = 100,
+        include_message: bool = True,
+        **kwargs
+    ) -> Tuple[List[Dict[str, Any]], str, Iterator[Dict[str, Any]]]:
+        """Generate blockchain scenario agents and a lazy stream of interactions.
+        
+        Agents and the run ID are created up front; interactions are produced one
+        at a time as the returned iterator is consumed, so callers that persist
+        them immediately never hold the full list in memory.
+        
+        Args:
+            num_agents: Number of agents to create
+            num_interactions: Number of interactions to generate
+            scenario: Type of scenario (dex, lending, nft, token_transfer)
+            blocks: Number of blocks to simulate
+            include_message: Whether to render each interaction's message text
             
-        eoa_wallets = []
-        for _ in range(num_eoa):
-            role = random.choice(eoa_roles)
-            eoa_wallets.append(self.create_agent("EOA", role))
+        Returns:
+            Tuple of (agents, run_id, interaction iterator). The agents list can
+            grow while the iterator runs if the scenario needs a missing contract.
+        """
+        # Validate scenario
+        if scenario not in self.SCENARIOS:
+            scenario = "token_transfer"  # Default to simple transfers
             
-        agents = eoa_wallets + contracts
+        agents, eoa_wallets, contracts = self._create_scenario_agents(num_agents, scenario)
         
-        # Create a run ID
-        run_id = str(uuid.uuid4()).replace('-', '_')
-        
-        # Generate interactions across a range of blocks
-        interactions = []
-        interactions_per_block = max(1, num_interactions // blocks)
-        
-        for _ in range(blocks):
-            # Generate interactions for this block
-            for _ in range(interactions_per_block):
-                # Select agents based on scenario logic
-                if scenario == "dex":
-                    # DEX interactions: trader/LP -> DEX contract
-                    sender = random.choice(eoa_wallets)
-                    dex_contracts = [c for c in contracts if c["role"] == "dex"]
-                    # Make sure we have at least one DEX contract
-                    if not dex_contracts:
-                        # Create a DEX contract if none exists
-                        new_contract = self.create_agent("contract", "dex")
-                        contracts.append(new_contract)
-                        agents.append(new_contract)
-                        dex_contracts = [new_contract]
-                    receiver = random.choice(dex_contracts)
-                        
-                elif scenario == "lending":
-                    # Lending interactions: borrower/lender -> lending contract
-                    sender = random.choice(eoa_wallets)
-                    lending_contracts = [c for c in contracts if c["role"] == "lending"]
-                    # Make sure we have at least one lending contract
-                    if not lending_contracts:
-                        # Create a lending contract if none exists
-                        new_contract = self.create_agent("contract", "lending")
-                        contracts.append(new_contract)
-                        agents.append(new_contract)
-                        lending_contracts = [new_contract]
-                    receiver = random.choice(lending_contracts)
-                
-                elif scenario == "nft":
-                    # NFT interactions: collector -> NFT contract
-                    sender = random.choice(eoa_wallets)
-                    nft_contracts = [c for c in contracts if c["role"] == "nft"]
-                    # Make sure we have at least one NFT contract
-                    if not nft_contracts:
-                        # Create an NFT contract if none exists
-                        new_contract = self.create_agent("contract", "nft")
-                        contracts.append(new_contract)
-                        agents.append(new_contract)
-                        nft_contracts = [new_contract]
-                    receiver = random.choice(nft_contracts)
-                
-                else:  # token_transfer
-                    # Token transfers between wallets
-                    sender = random.choice(eoa_wallets)
-                    if random.random() < 0.3:  # 30% chance for wallet-to-contract
-                        receiver = random.choice(contracts) if contracts else random.choice(eoa_wallets)
-                    else:  # 70% chance for wallet-to-wallet
-                        receiver = random.choice([w for w in eoa_wallets if w["id"] != sender["id"]])
-                
-                # Generate the interaction
-                interaction = self.generate_interaction(
-                    sender, 
-                    receiver, 
-                    scenario=scenario,
-                    block_number=self.current_block
-                )
-                
-                # Add run ID
-                interaction["run_id"] = run_id
-                interactions.append(interaction)
+        # Create a run ID; interned so every interaction shares one string object
+        run_id = sys.intern(_format_id(secrets.token_hex(16)))
+        
+        interaction_iter = self._iter_interactions(
+            scenario, agents, eoa_wallets, contracts, run_id,
+            _block_counts(num_interactions, blocks), include_message
+        )
+        return agents, run_id, interaction_iter
+    
+    def generate_data_json(
+        self,
+        num_agents: int,
+        num_interactions: int,
+        scenario: str = "token_transfer",
+        blocks: int = 100,
+        include_message: bool = True,
+        **kwargs
+    ) -> bytes:
+        """Generate blockchain scenario data serialized directly to JSON bytes.
+        
+        Interactions are encoded one at a time as they are generated, so the
+        full list of interaction dicts is never held alongside its JSON.
+        
+        Args:
+            num_agents: Number of agents to create
+            num_interactions: Number of interactions to generate
+            scenario: Type of scenario (dex, lending, nft, token_transfer)
+            blocks: Number of blocks to simulate
+            include_message: Whether to render each interaction's message text
             
-            # Advance blockchain state
-            self._advance_blockchain()
+        Returns:
+            UTF-8 JSON object with the same keys as generate_data's result
+        """
+        # Validate scenario
+        if scenario not in self.SCENARIOS:
+            scenario = "token_transfer"  # Default to simple transfers
+        
+        agents, run_id, interaction_iter = self.generate_data_iter(
+            num_agents, num_interactions, scenario=scenario, blocks=blocks,
+            include_message=include_message
+        )
+        
+        output = bytearray(b'{"transactions":[')
+        for index, interaction in enumerate(interaction_iter):
+            if index:
+                output += b","
+            output += _json_bytes(interaction)
+        
+        # Wallets go after the transactions: the scenario may add contracts while they stream
+        output += b'],"wallets":'
+        output += _json_bytes(agents)
+        metadata = _json_bytes({
+            "run_id": run_id,
+            "scenario": scenario,
+            "blockchain": "ethereum",
+            "start_block": self.current_block - blocks,
+            "end_block": self.current_block - 1
+        })
+        output += b","
+        output += metadata[1:]  # splice the metadata object's members into this one
+        return bytes(output)
+    
+    def generate_data_columnar(
+        self,
+        num_agents: int,
+        num_interactions: int,
+        scenario: str = "token_transfer",
+        blocks: int = 100,
+        include_message: bool = True,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Generate blockchain scenario data with interactions stored column-wise.
+        
+        Same data as generate_data, but "transactions" is an InteractionColumns
+        store filled directly from the per-row draws, so no nested dicts are
+        built per interaction unless to_dict_list() is called.
+        
+        Args:
+            num_agents: Number of agents to create
+            num_interactions: Number of interactions to generate
+            scenario: Type of scenario (dex, lending, nft, token_transfer)
+            blocks: Number of blocks to simulate
+            include_message: Whether to render each interaction's message text
+            
+        Returns:
+            Dictionary containing agents, interaction columns, and run metadata
+        """
+        # Validate scenario
+        if scenario not in self.SCENARIOS:
+            scenario = "token_transfer"  # Default to simple transfers
+        
+        agents, eoa_wallets, contracts = self._create_scenario_agents(num_agents, scenario)
+        run_id = sys.intern(_format_id(secrets.token_hex(16)))
+        columns = InteractionColumns(run_id=run_id, scenario=scenario)
+        
+        for sender, receiver, interaction_type in self._iter_pairs(
+            scenario, agents, eoa_wallets, contracts, _block_counts(num_interactions, blocks)
+        ):
+            (interaction_type, tx_hash, gas_price, gas_limit, gas_used, value,
+             token_symbol, token_amount, message) = self._draw_interaction(
+                sender, receiver, scenario, include_message, interaction_type
+            )
+            columns.tx_hash.append(tx_hash)
+            columns.block_number.append(self.current_block)
+            columns.timestamp.append(self._current_time_iso())
+            columns.sender.append(sender)
+            columns.receiver.append(receiver)
+            columns.interaction_type.append(interaction_type)
+            columns.value.append(value)
+            columns.gas_price.append(gas_price)
+            columns.gas_limit.append(gas_limit)
+            columns.gas_used.append(gas_used)
+            columns.token_symbol.append(token_symbol)
+            columns.token_amount.append(token_amount)
+            columns.message.append(message)
+        
+        return {
+            "wallets": agents,
+            "transactions": columns,
+            "run_id": run_id,
+            "scenario": scenario,
+            "blockchain": "ethereum",
+            "start_block": self.current_block - blocks,
+            "end_block": self.current_block - 1
+        }
+    
+    def generate_data_parallel(
+        self,
+        num_agents: int,
+        num_interactions: int,
+        scenario: str = "token_transfer",
+        blocks: int = 100,
+        workers: Optional[int] = None,
+        include_message: bool = True,
+        min_parallel_interactions: int = PARALLEL_MIN_INTERACTIONS,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Generate blockchain scenario data, sharding the blocks across processes.
+        
+        Agents are created in this process; each worker then generates the
+        interactions for a contiguous range of blocks with its own RNG seeded
+        from this generator, so seeded runs stay reproducible. Runs smaller than
+        min_parallel_interactions, limited to one worker, or with no interactions
+        to place in blocks are generated serially with generate_data instead.
+        
+        Args:
+            num_agents: Number of agents to create
+            num_interactions: Number of interactions to generate
+            scenario: Type of scenario (dex, lending, nft, token_transfer)
+            blocks: Number of blocks to simulate
+            workers: Number of worker processes (defaults to the CPU count)
+            include_message: Whether to render each interaction's message text
+            min_parallel_interactions: Smallest run that is sharded across processes
             
-            # Limit to requested number of interactions if specified
-            if len(interactions) >= num_interactions:
-                interactions = interactions[:num_interactions]
-                break
+        Returns:
+            Dictionary containing agents, interactions, and run metadata
+        """
+        # Validate scenario
+        if scenario not in self.SCENARIOS:
+            scenario = "token_transfer"  # Default to simple transfers
+        
+        num_workers = workers or os.cpu_count() or 1
+        block_counts = _block_counts(num_interactions, blocks)
+        if not block_counts or num_interactions < min_parallel_interactions or num_workers == 1:
+            return self.generate_data(
+                num_agents, num_interactions, scenario=scenario, blocks=blocks,
+                include_message=include_message
+            )
+        
+        agents, eoa_wallets, contracts = self._create_scenario_agents(num_agents, scenario)
+        # Workers cannot add agents, so create the scenario's receiver contract here
+        self._ensure_scenario_contract(scenario, agents, contracts)
+        run_id = sys.intern(_format_id(secrets.token_hex(16)))
+        
+        num_shards = max(1, min(num_workers, len(block_counts)))
+        shard_size = -(-len(block_counts) // num_shards)  # ceiling division
+        
+        with ProcessPoolExecutor(max_workers=num_shards) as executor:
+            futures = []
+            for start in range(0, len(block_counts), shard_size):
+                shard_counts = block_counts[start:start + shard_size]
+                futures.append(executor.submit(
+                    _generate_block_shard,
+                    self._rng.getrandbits(64),
+                    scenario,
+                    eoa_wallets,
+                    contracts,
+                    run_id,
+                    self.current_block,
+                    self.current_time,
+                    self.block_time,
+                    shard_counts,
+                    include_message
+                ))
+                # Move this generator's chain past the shard's blocks
+                for _ in shard_counts:
+                    self._advance_blockchain()
+            interactions = list(chain.from_iterable(future.result() for future in futures))
         
         return {
             "wallets": agents,
@@ -501,32 +1105,180 @@ class BlockchainScenarioGenerator(ScenarioGenerator):
             "start_block": self.current_block - blocks,
             "end_block": self.current_block - 1
         }
+    
+    def _ensure_scenario_contract(
+        self,
+        scenario: str,
+        agents: List[Dict[str, Any]],
+        contracts: List[Dict[str, Any]]
+    ) -> None:
+        """Create the contract a scenario sends to if no contract has that role yet."""
+        role = self.RECEIVER_ROLES.get(scenario)
+        if role and not any(c["role"] == role for c in contracts):
+            new_contract = self.create_agent("contract", role)
+            contracts.append(new_contract)
+            agents.append(new_contract)
+    
+    def _create_scenario_agents(
+        self,
+        num_agents: int,
+        scenario: str
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Create the wallets and contracts for a scenario.
+        
+        Returns:
+            Tuple of (all agents, EOA wallets, contracts)
+        """
+        # Determine agent distribution
+        num_contracts = max(1, num_agents // 5)  # 20% contracts
+        num_eoa = num_agents - num_contracts
+        
+        # Select roles based on scenario
+        contract_roles = self.SCENARIOS[scenario]["contracts"]
+        eoa_roles = self.SCENARIOS[scenario]["eoawallet_roles"]
+        
+        # Create agents (wallets and contracts), drawing all roles in one batch
+        created_at = _utc_now_iso()
+        contracts = self.create_agents(num_contracts, "contract", contract_roles, created_at)
+        eoa_wallets = self.create_agents(num_eoa, "EOA", eoa_roles, created_at)
+            
+        agents = eoa_wallets + contracts
+        return agents, eoa_wallets, contracts
+    
+    def _iter_interactions(
+        self,
+        scenario: str,
+        agents: List[Dict[str, Any]],
+        eoa_wallets: List[Dict[str, Any]],
+        contracts: List[Dict[str, Any]],
+        run_id: str,
+        block_counts: Iterable[int],
+        include_message: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield scenario interactions block by block, advancing the chain as it goes."""
+        generate_interaction = self.generate_interaction  # bound once, not per interaction
+        for sender, receiver, interaction_type in self._iter_pairs(
+            scenario, agents, eoa_wallets, contracts, block_counts
+        ):
+            # Generate the interaction, tagged with the run ID as it is built
+            yield generate_interaction(
+                sender, 
+                receiver, 
+                scenario=scenario,
+                block_number=self.current_block,
+                include_message=include_message,
+                run_id=run_id,
+                interaction_type=interaction_type
+            )
+    
+    def _iter_pairs(
+        self,
+        scenario: str,
+        agents: List[Dict[str, Any]],
+        eoa_wallets: List[Dict[str, Any]],
+        contracts: List[Dict[str, Any]],
+        block_counts: Iterable[int]
+    ) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any], str]]:
+        """Yield (sender, receiver, interaction type) block by block, advancing the chain between blocks."""
+        rng = self._rng
+        num_eoa = len(eoa_wallets)
+        eoa_indices = range(num_eoa)
+        interaction_types = self.SCENARIOS[scenario]["interactions"]
+        
+        # DEX, lending and NFT interactions all go to a contract with the scenario's role;
+        # filter those contracts once instead of for every interaction
+        receiver_role = self.RECEIVER_ROLES.get(scenario)
+        role_contracts = [c for c in contracts if c["role"] == receiver_role]
+        
+        for block_count in block_counts:
+            # Draw every sender and interaction type for this block in one batch each
+            sender_indices = rng.choices(eoa_indices, k=block_count)
+            block_types = rng.choices(interaction_types, k=block_count)
+            
+            if receiver_role:
+                # Make sure we have at least one contract with the scenario's role
+                if not role_contracts:
+                    new_contract = self.create_agent("contract", receiver_role)
+                    contracts.append(new_contract)
+                    agents.append(new_contract)
+                    role_contracts.append(new_contract)
+                
+                # Wallet -> scenario contract, with the block's receivers drawn in one batch
+                for sender_idx, interaction_type, receiver in zip(
+                    sender_indices, block_types, rng.choices(role_contracts, k=block_count)
+                ):
+                    yield eoa_wallets[sender_idx], receiver, interaction_type
+            
+            else:  # token_transfer
+                for sender_idx, interaction_type in zip(sender_indices, block_types):
+                    # Token transfers between wallets (a lone wallet can only pay a contract)
+                    if num_eoa < 2 or rng.random() < 0.3:  # 30% chance for wallet-to-contract
+                        receiver = rng.choice(contracts) if contracts else rng.choice(eoa_wallets)
+                    else:  # 70% chance for wallet-to-wallet
+                        # Draw from the other num_eoa - 1 wallets by skipping over the sender
+                        receiver_idx = rng.randrange(num_eoa - 1)
+                        if receiver_idx >= sender_idx:
+                            receiver_idx += 1
+                        receiver = eoa_wallets[receiver_idx]
+                    
+                    yield eoa_wallets[sender_idx], receiver, interaction_type
+            
+            # Advance blockchain state
+            self._advance_blockchain()
+
+
+def _generate_block_shard(
+    seed: int,
+    scenario: str,
+    eoa_wallets: List[Dict[str, Any]],
+    contracts: List[Dict[str, Any]],
+    run_id: str,
+    start_block: int,
+    start_time: datetime,
+    block_time: int,
+    block_counts: List[int],
+    include_message: bool = True
+) -> List[Dict[str, Any]]:
+    """Generate the interactions for a contiguous range of blocks (process pool worker)."""
+    generator = BlockchainScenarioGenerator(seed=seed)
+    generator.current_block = start_block
+    generator.current_time = start_time
+    generator.block_time = block_time
+    agents = eoa_wallets + contracts
+    return list(generator._iter_interactions(
+        scenario, agents, eoa_wallets, contracts, run_id, block_counts, include_message
+    ))
 
 
 class DataGenerator:
     """Generate synthetic blockchain data for testing."""
     
-    def __init__(self, scenario: Optional[str] = None):
-        """Initialize blockchain data generator."""
-        # Web3 blockchain scenarios
-        self.blockchain_scenarios = {
-            "dex": "Decentralized Exchange Trading",
-            "lending": "Lending Protocol Activity",
-            "nft": "NFT Marketplace",
-            "token_transfer": "Token Transfer Network"
-        }
+    # Web3 blockchain scenarios
+    BLOCKCHAIN_SCENARIOS = MappingProxyType({
+        "dex": "Decentralized Exchange Trading",
+        "lending": "Lending Protocol Activity",
+        "nft": "NFT Marketplace",
+        "token_transfer": "Token Transfer Network"
+    })
+    
+    def __init__(self, scenario: Optional[str] = None, seed: Optional[int] = None):
+        """Initialize blockchain data generator.
         
+        Args:
+            scenario: Default blockchain scenario (dex, lending, nft, token_transfer)
+            seed: Optional seed for reproducible synthetic data
+        """
         # Set up blockchain scenario generator
-        self.scenario = scenario if scenario in self.blockchain_scenarios else "token_transfer"
-        self.scenario_generator = BlockchainScenarioGenerator()
+        self.scenario = scenario if scenario in self.BLOCKCHAIN_SCENARIOS else "token_transfer"
+        self.scenario_generator = BlockchainScenarioGenerator(seed=seed)
     
     def create_wallet(self, wallet_type: str = "EOA", role: Optional[str] = None) -> Dict[str, Any]:
         """Create a single blockchain wallet."""
         return self.scenario_generator.create_agent(wallet_type, role)
 
-    def create_wallets(self, num_wallets: int, wallet_type: str = "EOA") -> List[Dict[str, Any]]:
-        """Create multiple blockchain wallets."""
-        return [self.create_wallet(wallet_type) for _ in range(num_wallets)]
+    def create_wallets(self, num_wallets: int, wallet_type: Optional[str] = "EOA") -> List[Dict[str, Any]]:
+        """Create multiple blockchain wallets sharing one creation timestamp."""
+        return self.scenario_generator.create_agents(num_wallets, wallet_type)
 
     def generate_transaction(
         self, 
@@ -564,6 +1316,72 @@ class DataGenerator:
             blocks=blocks
         )
     
+    def iter_blockchain_data(
+        self,
+        num_wallets: int,
+        num_transactions: int,
+        scenario: Optional[str] = None,
+        blocks: int = 100
+    ) -> Tuple[List[Dict[str, Any]], str, Iterator[Dict[str, Any]]]:
+        """Generate wallets and a lazy stream of blockchain transactions.
+        
+        Memory stays bounded for write-through pipelines that persist each
+        transaction as it is produced; see generate_data_iter for details.
+        """
+        if not scenario:
+            scenario = self.scenario
+            
+        return self.scenario_generator.generate_data_iter(
+            num_agents=num_wallets,
+            num_interactions=num_transactions,
+            scenario=scenario,
+            blocks=blocks
+        )
+    
+    def generate_blockchain_data_json(
+        self,
+        num_wallets: int,
+        num_transactions: int,
+        scenario: Optional[str] = None,
+        blocks: int = 100
+    ) -> bytes:
+        """Generate a blockchain dataset serialized straight to JSON bytes.
+        
+        Like generate_blockchain_data, but encoded with orjson when available;
+        see generate_data_json for details.
+        """
+        if not scenario:
+            scenario = self.scenario
+            
+        return self.scenario_generator.generate_data_json(
+            num_agents=num_wallets,
+            num_interactions=num_transactions,
+            scenario=scenario,
+            blocks=blocks
+        )
+    
+    def generate_blockchain_data_columnar(
+        self,
+        num_wallets: int,
+        num_transactions: int,
+        scenario: Optional[str] = None,
+        blocks: int = 100
+    ) -> Dict[str, Any]:
+        """Generate a blockchain dataset with transactions stored column-wise.
+        
+        Like generate_blockchain_data, but "transactions" is an InteractionColumns
+        store; call its to_dict_list() to get the usual transaction dicts.
+        """
+        if not scenario:
+            scenario = self.scenario
+            
+        return self.scenario_generator.generate_data_columnar(
+            num_agents=num_wallets,
+            num_interactions=num_transactions,
+            scenario=scenario,
+            blocks=blocks
+        )
+    
     def generate_scenario_data(
         self,
         num_agents: int,
@@ -594,4 +1412,4 @@ class DataGenerator:
     
     def get_available_scenarios(self) -> Dict[str, str]:
         """Get available blockchain scenarios with descriptions."""
-        return self.blockchain_scenarios
+        return dict(self.BLOCKCHAIN_SCENARIOS)
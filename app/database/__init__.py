@@ -1,5 +1,6 @@
 """Database module."""
 from typing import Optional
+import asyncio
 import logging
 from ..config import get_settings
 from .base import DatabaseInterface
@@ -10,6 +11,8 @@ logger = logging.getLogger(__name__)
 
 # Global database instance
 _database: Optional[DatabaseInterface] = None
+# Serializes first-time creation only; callers skip it once _database is set
+_database_lock = asyncio.Lock()
 
 async def create_database() -> DatabaseInterface:
     """Create a new database instance.
@@ -42,5 +45,8 @@ async def get_database() -> DatabaseInterface:
     """
     global _database
     if _database is None:
-        _database = await create_database()
+        async with _database_lock:
+            # Another caller may have connected while we waited for the lock
+            if _database is None:
+                _database = await create_database()
     return _database
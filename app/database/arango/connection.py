@@ -1,17 +1,56 @@
 """ArangoDB connection module."""
+import asyncio
 import logging
+import random
 import time
-from typing import Optional, Any, Union
+from typing import Optional, Any, Union, Dict, Set, Tuple
 
 from arango import ArangoClient
 from arango.database import StandardDatabase
-from arango.exceptions import ServerConnectionError, DatabaseCreateError
+from arango.exceptions import ServerConnectionError, DatabaseCreateError, CollectionListError
 from urllib3.exceptions import NewConnectionError, MaxRetryError
 
 logger = logging.getLogger(__name__)
 
+# ArangoDB error code for a request against a database that does not exist
+DATABASE_NOT_FOUND = 1228
+
+# ArangoDB clients shared by every connection to the same server
+_clients: Dict[Tuple[str, int], ArangoClient] = {}
+
+
+def _get_client(host: str, port: int) -> ArangoClient:
+    """Get the shared ArangoDB client for a server, creating it on first use.
+    
+    Args:
+        host: ArangoDB host
+        port: ArangoDB port
+        
+    Returns:
+        ArangoDB client for http://host:port
+    """
+    client = _clients.get((host, port))
+    if client is None:
+        # Reasonable timeout; creating the client sends no request
+        client = _clients[(host, port)] = ArangoClient(
+            hosts=f"http://{host}:{port}",
+            request_timeout=10  # 10 second timeout
+        )
+    return client
+
+
 class ArangoConnection:
     """ArangoDB connection class."""
+    
+    # (name, is_edge) for every collection the application needs
+    REQUIRED_COLLECTIONS = (
+        # Collections for nodes
+        ("agents", False),
+        ("runs", False),
+        # Edge collections
+        ("interactions", True),
+        ("participations", True)
+    )
 
     def __init__(self, host: str, port: int, username: str, password: str, db_name: str):
         """Initialize ArangoDB connection.
@@ -32,9 +71,17 @@ class ArangoConnection:
         self.db = None
     
     async def connect(self) -> None:
-        """Connect to ArangoDB database."""
-        retries = 5  # Increased number of retries
-        retry_delay = 2  # seconds
+        """Connect to ArangoDB database.
+        
+        The client is shared per server; failed attempts are retried with
+        exponential backoff plus random jitter, capped per attempt and by a
+        total budget for time spent waiting between attempts.
+        """
+        retries = 5
+        retry_delay = 1  # seconds, doubled after each failed attempt
+        max_retry_delay = 8  # seconds
+        max_total_wait = 15  # seconds of backoff across all attempts
+        remaining_wait = max_total_wait
         connection_errors = (
             ServerConnectionError, 
             DatabaseCreateError, 
@@ -44,62 +91,56 @@ class ArangoConnection:
             ConnectionRefusedError
         )
         
+        self.client = _get_client(self.host, self.port)
+        
         for attempt in range(retries):
             try:
-                # Create ArangoDB client with a reasonable timeout
-                self.client = ArangoClient(
-                    hosts=f"http://{self.host}:{self.port}",
-                    request_timeout=10  # 10 second timeout
-                )
-                
-                # Connect to system database first (to create our database if needed)
-                sys_db = self.client.db("_system", username=self.username, password=self.password)
-                
-                # Create database if it doesn't exist
-                if not sys_db.has_database(self.db_name):
+                # Connect to our database; listing its collections is the liveness
+                # probe, so an existing database costs a single round-trip
+                db = self.client.db(self.db_name, username=self.username, password=self.password)
+                try:
+                    existing = {collection["name"] for collection in db.collections()}
+                except CollectionListError as e:
+                    if e.error_code != DATABASE_NOT_FOUND:
+                        raise
+                    # Only a missing database needs the system database
                     logger.info(f"Creating database '{self.db_name}'")
+                    sys_db = self.client.db("_system", username=self.username, password=self.password)
                     sys_db.create_database(self.db_name)
+                    existing = set()
                 
-                # Connect to our database
-                self.db = self.client.db(self.db_name, username=self.username, password=self.password)
-                
-                # Ensure required collections exist
-                self._ensure_collections()
+                # Ensure required collections exist; only then expose the handle
+                self._ensure_collections(db, existing)
+                self.db = db
                 
                 logger.info("Successfully connected to ArangoDB database")
                 return
             except connection_errors as e:
                 logger.warning(f"Failed to connect to ArangoDB database (attempt {attempt + 1}/{retries}): {str(e)}")
-                if attempt < retries - 1:
-                    import asyncio
-                    # Increase the delay with each retry (exponential backoff)
-                    current_delay = retry_delay * (attempt + 1)
-                    logger.info(f"Waiting {current_delay}s before next connection attempt...")
+                if attempt < retries - 1 and remaining_wait > 0:
+                    # Exponential backoff with jitter so restarting services don't retry in lockstep
+                    backoff = min(retry_delay * 2 ** attempt, max_retry_delay)
+                    current_delay = min(backoff + random.uniform(0, 0.5 * backoff), remaining_wait)
+                    remaining_wait -= current_delay
+                    logger.info(f"Waiting {current_delay:.1f}s before next connection attempt...")
                     await asyncio.sleep(current_delay)
                     continue
-                logger.error(f"All connection attempts failed after {retries} tries: {str(e)}")
+                logger.error(f"All connection attempts failed after {attempt + 1} tries: {str(e)}")
                 raise
     
-    def _ensure_collections(self) -> None:
-        """Ensure required collections exist with proper error handling."""
+    def _ensure_collections(self, db: StandardDatabase, existing: Set[str]) -> None:
+        """Ensure required collections exist with proper error handling.
+        
+        Args:
+            db: Database to create the missing collections in
+            existing: Names of the collections already in the database, listed
+                once by connect(); only missing collections are created
+        """
         try:
-            # Collections for nodes
-            if not self.db.has_collection("agents"):
-                logger.info("Creating 'agents' collection")
-                self.db.create_collection("agents")
-            
-            if not self.db.has_collection("runs"):
-                logger.info("Creating 'runs' collection")
-                self.db.create_collection("runs")
-                
-            # Edge collections
-            if not self.db.has_collection("interactions"):
-                logger.info("Creating 'interactions' edge collection")
-                self.db.create_collection("interactions", edge=True)
-            
-            if not self.db.has_collection("participations"):
-                logger.info("Creating 'participations' edge collection")
-                self.db.create_collection("participations", edge=True)
+            for name, edge in self.REQUIRED_COLLECTIONS:
+                if name not in existing:
+                    logger.info(f"Creating '{name}' {'edge ' if edge else ''}collection")
+                    db.create_collection(name, edge=edge)
                 
             logger.info("All required collections created or verified")
         except Exception as e:
@@ -111,7 +152,8 @@ class ArangoConnection:
         try:
             if self.client:
                 # ArangoDB Python driver doesn't have an explicit disconnect method,
-                # but we can close any open connections by dereferencing
+                # but we can close any open connections by dereferencing; the shared
+                # client itself stays cached for the next connect
                 self.db = None
                 self.client = None
                 logger.info("Disconnected from ArangoDB database")
@@ -55,13 +55,9 @@ class AlertOperations(BaseOperations):
             
             logger.info(f"Storing alert with key: {key}")
             
-            # Check if alert exists, update or insert
-            if self._document_exists(alerts_collection, key):
-                alerts_collection.update(key, alert_data)
-                logger.info(f"Updated existing alert: {key}")
-            else:
-                alerts_collection.insert(alert_data)
-                logger.info(f"Inserted new alert: {key}")
+            # Insert, or update the existing alert in place, in a single round-trip
+            alerts_collection.insert(alert_data, overwrite_mode="update")
+            logger.info(f"Stored alert: {key}")
                 
             # If we have entity information, link entity to alert
             entity = alert_data.get('entity')
@@ -89,18 +85,17 @@ class AlertOperations(BaseOperations):
                     entity_to_alert = self._db.collection('entity_to_alert')
                     edge_key = f"{entity.replace('0x', '').lower()}_{key}"
                     
-                    # Check if edge already exists
+                    # Keep the existing edge if this alert was already linked
                     try:
-                        if not self._document_exists(entity_to_alert, edge_key):
-                            entity_to_alert.insert({
-                                '_key': edge_key,
-                                '_from': f'{from_collection}/{entity}',
-                                '_to': f'alerts/{key}',
-                                'timestamp': alert_data.get('timestamp'),
-                                'alert_type': alert_data.get('type'),
-                                'severity': alert_data.get('severity')
-                            })
-                            logger.info(f"Created entity_to_alert edge for alert: {key}")
+                        entity_to_alert.insert({
+                            '_key': edge_key,
+                            '_from': f'{from_collection}/{entity}',
+                            '_to': f'alerts/{key}',
+                            'timestamp': alert_data.get('timestamp'),
+                            'alert_type': alert_data.get('type'),
+                            'severity': alert_data.get('severity')
+                        }, overwrite_mode="ignore")
+                        logger.info(f"Ensured entity_to_alert edge for alert: {key}")
                     except Exception as e:
                         logger.warning(f"Error creating entity_to_alert edge: {e}")
                 
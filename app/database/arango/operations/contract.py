@@ -61,13 +61,9 @@ class ContractOperations(BaseOperations):
             
             logger.info(f"Storing contract with key: {key}")
             
-            # Check if contract exists, update or insert
-            if self._document_exists(contracts_collection, key):
-                contracts_collection.update(key, contract_data)
-                logger.info(f"Updated existing contract: {key}")
-            else:
-                contracts_collection.insert(contract_data)
-                logger.info(f"Inserted new contract: {key}")
+            # Insert, or update the existing contract in place, in a single round-trip
+            contracts_collection.insert(contract_data, overwrite_mode="update")
+            logger.info(f"Stored contract: {key}")
                 
             # If we have creator info, link creator to contract
             creator = contract_data.get('creator')
@@ -81,17 +77,15 @@ class ContractOperations(BaseOperations):
                 creator_addr = creator.replace('0x', '').lower()
                 creator_key = f"{chain}_{creator_addr}"
                 
-                # Ensure creator wallet exists
-                if not self._document_exists(wallets_collection, creator_key):
-                    # Create minimal creator wallet
-                    wallets_collection.insert({
-                        '_key': creator_key,
-                        'address': creator,
-                        'chain': chain,
-                        'wallet_type': 'EOA',
-                        'first_seen': contract_data.get('creation_timestamp'),
-                        'last_active': contract_data.get('creation_timestamp')
-                    })
+                # Ensure creator wallet exists; an existing wallet is left untouched
+                wallets_collection.insert({
+                    '_key': creator_key,
+                    'address': creator,
+                    'chain': chain,
+                    'wallet_type': 'EOA',
+                    'first_seen': contract_data.get('creation_timestamp'),
+                    'last_active': contract_data.get('creation_timestamp')
+                }, overwrite_mode="ignore")
                 
                 # Create wallet_to_contract edge collection if it doesn't exist
                 if not self._db.has_collection('wallet_to_contract'):
@@ -103,19 +97,18 @@ class ContractOperations(BaseOperations):
                 wallet_to_contract = self._db.collection('wallet_to_contract')
                 edge_key = f"{creator_key}_created_{key}"
                 
-                # Check if edge already exists
+                # Keep the existing edge if this contract's creation was already linked
                 try:
-                    if not self._document_exists(wallet_to_contract, edge_key):
-                        wallet_to_contract.insert({
-                            '_key': edge_key,
-                            '_from': f'wallets/{creator_key}',
-                            '_to': f'contracts/{key}',
-                            'relationship': 'created',
-                            'tx_hash': contract_data.get('creation_tx'),
-                            'timestamp': contract_data.get('creation_timestamp'),
-                            'chain': chain
-                        })
-                        logger.info(f"Created wallet_to_contract edge for contract creation: {key}")
+                    wallet_to_contract.insert({
+                        '_key': edge_key,
+                        '_from': f'wallets/{creator_key}',
+                        '_to': f'contracts/{key}',
+                        'relationship': 'created',
+                        'tx_hash': contract_data.get('creation_tx'),
+                        'timestamp': contract_data.get('creation_timestamp'),
+                        'chain': chain
+                    }, overwrite_mode="ignore")
+                    logger.info(f"Ensured wallet_to_contract edge for contract creation: {key}")
                 except Exception as e:
                     logger.warning(f"Error creating wallet_to_contract edge: {e}")
                 
@@ -52,13 +52,9 @@ class EventOperations(BaseOperations):
             
             logger.info(f"Storing event with key: {key}")
             
-            # Check if event exists, update or insert
-            if self._document_exists(events_collection, key):
-                events_collection.update(key, event_data)
-                logger.info(f"Updated existing event: {key}")
-            else:
-                events_collection.insert(event_data)
-                logger.info(f"Inserted new event: {key}")
+            # Insert, or update the existing event in place, in a single round-trip
+            events_collection.insert(event_data, overwrite_mode="update")
+            logger.info(f"Stored event: {key}")
                 
             return event_data
         except Exception as e:
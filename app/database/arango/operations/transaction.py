@@ -106,31 +106,29 @@ class TransactionOperations(BaseOperations):
             
             wallets_collection = self._db.collection('wallets')
             
-            # Check if sender wallet exists, create if not
-            if not self._document_exists(wallets_collection, from_key):
-                logger.info(f"Creating sender wallet: {from_address}")
+            # Create the sender wallet if missing; an existing wallet is left untouched
+            logger.info(f"Ensuring sender wallet exists: {from_address}")
+            wallets_collection.insert({
+                '_key': from_key,
+                'address': from_address,
+                'chain': tx_doc['chain'],
+                'type': 'EOA',  # Default to EOA
+                'first_seen': tx_doc['timestamp'],
+                'last_active': tx_doc['timestamp']
+            }, overwrite_mode="ignore")
+            
+            # If receiver address exists, create that wallet too if missing
+            if to_address:
+                to_key = f"{to_address}_{tx_doc['chain']}".replace('-', '_').replace(':', '_').replace('/', '_')
+                logger.info(f"Ensuring receiver wallet exists: {to_address}")
                 wallets_collection.insert({
-                    '_key': from_key,
-                    'address': from_address,
+                    '_key': to_key,
+                    'address': to_address,
                     'chain': tx_doc['chain'],
-                    'type': 'EOA',  # Default to EOA
+                    'type': 'unknown',  # Default to unknown, could be contract or EOA
                     'first_seen': tx_doc['timestamp'],
                     'last_active': tx_doc['timestamp']
-                })
-            
-            # If receiver address exists, check/create that wallet too
-            if to_address:
-                to_key = f"{to_address}_{tx_doc['chain']}".replace('-', '_').replace(':', '_').replace('/', '_')
-                if not self._document_exists(wallets_collection, to_key):
-                    logger.info(f"Creating receiver wallet: {to_address}")
-                    wallets_collection.insert({
-                        '_key': to_key,
-                        'address': to_address,
-                        'chain': tx_doc['chain'],
-                        'type': 'unknown',  # Default to unknown, could be contract or EOA
-                        'first_seen': tx_doc['timestamp'],
-                        'last_active': tx_doc['timestamp']
-                    })
+                }, overwrite_mode="ignore")
             
             # Calculate risk score if not provided
             if 'risk_score' not in tx_doc:
@@ -139,16 +137,10 @@ class TransactionOperations(BaseOperations):
                 tx_doc['risk_score'] = calculate_transaction_risk(tx_doc)
                 logger.info(f"Calculated risk score for transaction {key}: {tx_doc['risk_score']}")
             
-            # Store transaction document
-            if self._document_exists(transactions_collection, key):
-                logger.info(f"Updating existing transaction: {key}")
-                # Update existing transaction
-                transactions_collection.update({'_key': key}, tx_doc)
-            else:
-                logger.info(f"Inserting new transaction: {key}")
-                # Insert new transaction with key
-                tx_doc['_key'] = key
-                transactions_collection.insert(tx_doc)
+            # Store transaction document: insert, or update the existing one in place
+            logger.info(f"Storing transaction: {key}")
+            tx_doc['_key'] = key
+            transactions_collection.insert(tx_doc, overwrite_mode="update")
             
             # Create wallet-to-wallet edge if we have both sender and receiver
             if to_address:
@@ -165,9 +157,9 @@ class TransactionOperations(BaseOperations):
                 }
                 
                 try:
-                    if not self._document_exists(wallet_to_wallet, edge_key):
-                        logger.info(f"Creating wallet-to-wallet edge: {from_address} -> {to_address}")
-                        wallet_to_wallet.insert(edge)
+                    # Keep the first edge for this transaction if it was already stored
+                    logger.info(f"Ensuring wallet-to-wallet edge: {from_address} -> {to_address}")
+                    wallet_to_wallet.insert(edge, overwrite_mode="ignore")
                 except DocumentInsertError as e:
                     logger.warning(f"Error creating wallet-to-wallet edge: {e}")
             
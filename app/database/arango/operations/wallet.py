@@ -56,13 +56,9 @@ class WalletOperations(BaseOperations):
             
             logger.info(f"Storing wallet with key: {key}")
             
-            # Check if wallet exists, update or insert
-            if self._document_exists(wallets_collection, key):
-                wallets_collection.update(key, wallet_data)
-                logger.info(f"Updated existing wallet: {key}")
-            else:
-                wallets_collection.insert(wallet_data)
-                logger.info(f"Inserted new wallet: {key}")
+            # Insert, or update the existing wallet in place, in a single round-trip
+            wallets_collection.insert(wallet_data, overwrite_mode="update")
+            logger.info(f"Stored wallet: {key}")
                 
             return wallet_data
         except Exception as e:
@@ -1,6 +1,7 @@
 """Tests for blockchain data generator module."""
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
+import json
 from unittest.mock import patch, MagicMock
 import sys
 import os
@@ -240,4 +241,196 @@ class TestBlockchainDataGenerator:
         assert "lending" in scenarios
         assert "nft" in scenarios
         assert "token_transfer" in scenarios
-        assert len(scenarios) >= 4
\ No newline at end of file
+        assert len(scenarios) >= 4
+
+    def test_generate_data_iter_streams_interactions(self):
+        """Test streaming interactions lazily from the scenario generator."""
+        agents, run_id, interactions = self.scenario_generator.generate_data_iter(
+            5, 12, scenario="token_transfer", blocks=4
+        )
+        
+        assert len(agents) == 5
+        assert not isinstance(interactions, list)
+        
+        start_block = self.scenario_generator.current_block
+        first = next(interactions)
+        assert first["run_id"] == run_id
+        assert first["metadata"]["block"] == start_block
+        
+        rest = list(interactions)
+        assert len(rest) == 11
+        assert all(tx["run_id"] == run_id for tx in rest)
+        
+        wallets, run_id, transactions = DataGenerator(scenario="nft").iter_blockchain_data(5, 12, blocks=4)
+        assert len(wallets) >= 5
+        assert sum(1 for tx in transactions if tx["run_id"] == run_id) == 12
+
+    def test_created_at_is_utc_iso_timestamp(self):
+        """Test that wallet creation timestamps are current UTC ISO strings."""
+        before = datetime.now(timezone.utc)
+        wallet = self.generator.create_wallet("EOA", "retail")
+        after = datetime.now(timezone.utc)
+        
+        created_at = datetime.fromisoformat(wallet["created_at"])
+        assert created_at.tzinfo is not None
+        assert before.replace(microsecond=0) <= created_at <= after
+        
+        # Wallets created in one batch share a single creation timestamp
+        wallets = self.generator.create_wallets(5)
+        assert len({w["created_at"] for w in wallets}) == 1
+        assert all(w["role"] in BlockchainScenarioGenerator.EOA_ROLES for w in wallets)
+        
+        # Without a wallet type, each wallet draws its own type and a matching role
+        wallets = DataGenerator(seed=3).create_wallets(40, None)
+        assert {w["type"] for w in wallets} == {"EOA", "contract"}
+        for wallet in wallets:
+            roles = BlockchainScenarioGenerator.EOA_ROLES if wallet["type"] == "EOA" \
+                else BlockchainScenarioGenerator.CONTRACT_ROLES
+            assert wallet["role"] in roles
+        assert len({w["created_at"] for w in wallets}) == 1
+        
+        # Without a type but with roles, each agent's type follows its role
+        agents = BlockchainScenarioGenerator(seed=3).create_agents(6, None, roles=("dex", "whale"))
+        for agent in agents:
+            assert agent["type"] == ("contract" if agent["role"] == "dex" else "EOA")
+
+    def test_seeded_generators_are_reproducible(self):
+        """Test that generators created with the same seed produce the same data."""
+        first = DataGenerator(scenario="dex", seed=42).generate_blockchain_data(6, 12, blocks=3)
+        second = DataGenerator(scenario="dex", seed=42).generate_blockchain_data(6, 12, blocks=3)
+        
+        assert [w["address"] for w in first["wallets"]] == [w["address"] for w in second["wallets"]]
+        assert [w["role"] for w in first["wallets"]] == [w["role"] for w in second["wallets"]]
+        assert [tx["interaction_id"] for tx in first["transactions"]] == \
+            [tx["interaction_id"] for tx in second["transactions"]]
+        assert [tx["message"] for tx in first["transactions"]] == \
+            [tx["message"] for tx in second["transactions"]]
+        # Run IDs stay unique so seeded runs never collide when stored
+        assert first["run_id"] != second["run_id"]
+
+    def test_generate_data_columnar(self):
+        """Test generating interactions into column storage."""
+        data = self.scenario_generator.generate_data_columnar(6, 10, scenario="lending", blocks=5)
+        columns = data["transactions"]
+        
+        assert data["scenario"] == "lending"
+        assert columns.run_id == data["run_id"]
+        assert len(columns.tx_hash) == 10
+        assert len(columns.gas_used) == len(columns.sender) == 10
+        
+        rows = columns.to_dict_list()
+        assert len(rows) == 10
+        assert len(columns) == 10
+        assert columns[3] == rows[3]
+        assert columns[-1] == rows[-1]
+        assert list(columns) == rows
+        for row, tx_hash in zip(rows, columns.tx_hash):
+            assert row["interaction_id"] == tx_hash
+            assert row["run_id"] == data["run_id"]
+            assert row["metadata"]["scenario"] == "lending"
+            assert row["metadata"]["transaction"]["hash"] == tx_hash
+        
+        # The DataGenerator wrapper draws the same transactions as the row-wise API
+        columnar = DataGenerator(scenario="nft", seed=5).generate_blockchain_data_columnar(6, 10, blocks=5)
+        rows = DataGenerator(scenario="nft", seed=5).generate_blockchain_data(6, 10, blocks=5)
+        assert columnar["scenario"] == "nft"
+        assert columnar["transactions"].tx_hash == [tx["interaction_id"] for tx in rows["transactions"]]
+
+    def test_generate_data_json(self):
+        """Test generating scenario data straight to JSON bytes."""
+        raw = BlockchainScenarioGenerator(seed=9).generate_data_json(8, 25, scenario="dex", blocks=5)
+        data = json.loads(raw)
+        expected = BlockchainScenarioGenerator(seed=9).generate_data(8, 25, scenario="dex", blocks=5)
+        
+        assert set(data) == set(expected)
+        assert data["scenario"] == "dex"
+        assert len(data["transactions"]) == 25
+        assert [w["id"] for w in data["wallets"]] == [w["id"] for w in expected["wallets"]]
+        # Token amounts wider than 64 bits survive serialization intact
+        assert [tx["metadata"]["token_amount"] for tx in data["transactions"]] == \
+            [tx["metadata"]["token_amount"] for tx in expected["transactions"]]
+        
+        # The DataGenerator wrapper encodes the same dataset as the row-wise API
+        raw = DataGenerator(scenario="lending", seed=9).generate_blockchain_data_json(8, 25, blocks=5)
+        rows = DataGenerator(scenario="lending", seed=9).generate_blockchain_data(8, 25, blocks=5)
+        assert [tx["interaction_id"] for tx in json.loads(raw)["transactions"]] == \
+            [tx["interaction_id"] for tx in rows["transactions"]]
+
+    def test_generate_data_parallel(self):
+        """Test generating scenario data with blocks sharded across worker processes."""
+        generator = BlockchainScenarioGenerator(seed=7)
+        start_block = generator.current_block
+        data = generator.generate_data_parallel(
+            8, 20, scenario="dex", blocks=4, workers=2, min_parallel_interactions=0
+        )
+        
+        assert data["scenario"] == "dex"
+        assert len(data["transactions"]) == 20
+        assert generator.current_block == start_block + 4
+        
+        blocks = [tx["metadata"]["block"] for tx in data["transactions"]]
+        assert blocks == sorted(blocks)
+        assert len({tx["interaction_id"] for tx in data["transactions"]}) == 20
+        
+        wallet_ids = {wallet["id"] for wallet in data["wallets"]}
+        for tx in data["transactions"]:
+            assert tx["run_id"] == data["run_id"]
+            assert tx["sender_id"] in wallet_ids
+            assert tx["receiver_id"] in wallet_ids
+        
+        # Small runs skip the process pool and match a serial run exactly
+        small = BlockchainScenarioGenerator(seed=7).generate_data_parallel(8, 20, scenario="dex", blocks=4)
+        serial = BlockchainScenarioGenerator(seed=7).generate_data(8, 20, scenario="dex", blocks=4)
+        assert [tx["interaction_id"] for tx in small["transactions"]] == \
+            [tx["interaction_id"] for tx in serial["transactions"]]
+        
+        # Runs with no interactions or no blocks fall back to the serial path too
+        empty = BlockchainScenarioGenerator(seed=7).generate_data_parallel(
+            8, 0, scenario="dex", blocks=4, workers=2, min_parallel_interactions=0
+        )
+        assert empty["transactions"] == []
+        no_blocks = BlockchainScenarioGenerator(seed=7).generate_data_parallel(
+            8, 20, scenario="dex", blocks=0, workers=2, min_parallel_interactions=0
+        )
+        assert no_blocks["transactions"] == []
+
+    def test_uneven_interaction_count(self):
+        """Test interaction counts that do not divide evenly across blocks."""
+        generator = BlockchainScenarioGenerator(seed=4)
+        start_block = generator.current_block
+        data = generator.generate_data(8, 23, scenario="lending", blocks=5)
+        
+        assert len(data["transactions"]) == 23
+        assert generator.current_block == start_block + 5
+        per_block = {}
+        for tx in data["transactions"]:
+            per_block[tx["metadata"]["block"]] = per_block.get(tx["metadata"]["block"], 0) + 1
+        assert sorted(per_block.values(), reverse=True) == [5, 5, 5, 4, 4]
+        
+        # Fewer interactions than blocks only fills the blocks that are needed
+        data = BlockchainScenarioGenerator(seed=4).generate_data(8, 3, scenario="lending", blocks=10)
+        assert len(data["transactions"]) == 3
+
+    def test_token_transfer_never_sends_to_self(self):
+        """Test wallet-to-wallet transfers always pick a different receiver."""
+        data = DataGenerator(scenario="token_transfer", seed=1).generate_blockchain_data(
+            6, 200, blocks=10
+        )
+        for tx in data["transactions"]:
+            assert tx["sender_id"] != tx["receiver_id"]
+        
+        # A single wallet has no peer to pay, so it transfers to contracts instead
+        data = DataGenerator(scenario="token_transfer").generate_blockchain_data(2, 10, blocks=5)
+        assert len(data["transactions"]) == 10
+
+    def test_generate_data_without_messages(self):
+        """Test skipping message rendering leaves the structured fields unchanged."""
+        with_messages = BlockchainScenarioGenerator(seed=3).generate_data(10, 30, scenario="dex", blocks=5)
+        without_messages = BlockchainScenarioGenerator(seed=3).generate_data(
+            10, 30, scenario="dex", blocks=5, include_message=False
+        )
+        
+        assert all(tx["message"] for tx in with_messages["transactions"])
+        assert all(tx["message"] is None for tx in without_messages["transactions"])
+        assert [tx["interaction_id"] for tx in without_messages["transactions"]] == \
+            [tx["interaction_id"] for tx in with_messages["transactions"]]